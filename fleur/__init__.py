@@ -1,8 +1,15 @@
-from .scatterstats import ScatterStats
+from .scatterstats import ScatterStats, scatterstats_batch
 from .betweenstats import BetweenStats
 from .barstats import BarStats
+from ._utils import themify_context
 
 from typing import Literal
 
 __version__: Literal["0.0.4"] = "0.0.4"
-__all__: list[str] = ["ScatterStats", "BetweenStats", "BarStats"]
+__all__: list[str] = [
+    "ScatterStats",
+    "BetweenStats",
+    "BarStats",
+    "scatterstats_batch",
+    "themify_context",
+]
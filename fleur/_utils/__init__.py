@@ -1,13 +1,25 @@
 from .count_decimals import _count_n_decimals
 from .infer_types import _infer_types
-from .theme import _get_first_n_colors
+from .theme import (
+    _get_first_n_colors,
+    _get_cycle_colors,
+    _themify,
+    themify_context,
+)
 from .beeswarm import _beeswarm
+from .violin import _violin_stats
+from .boxplot import _box_stats
 from .input_data_handling import _InputDataHandler
 
 __all__: list[str] = [
     "_count_n_decimals",
     "_infer_types",
     "_beeswarm",
+    "_violin_stats",
+    "_box_stats",
     "_InputDataHandler",
     "_get_first_n_colors",
+    "_get_cycle_colors",
+    "_themify",
+    "themify_context",
 ]
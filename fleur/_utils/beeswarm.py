@@ -21,16 +21,18 @@ def _beeswarm(y, width):
     x_offsets = np.zeros_like(y, dtype=float)
     dx = width / (max_bin_count // 2 + 1e-5)  # add epsilon to avoid div by zero
 
-    for ymin, ymax in zip(bin_edges[:-1], bin_edges[1:]):
-        in_bin = np.where((y > ymin) & (y <= ymax))[0]
-        if len(in_bin) == 0:
-            continue
-
-        sorted_indices = in_bin[np.argsort(y[in_bin])]
-        left = sorted_indices[::2]
-        right = sorted_indices[1::2]
-
-        x_offsets[left] = dx * (0.5 + np.arange(len(left)))
-        x_offsets[right] = -dx * (0.5 + np.arange(len(right)))
+    # once sorted, each (ymin, ymax] bin is a contiguous run of values, so the
+    # rank of a value in its bin is its distance to the start of the run
+    order = np.argsort(y)
+    bin_idx = np.searchsorted(bin_edges, y[order]) - 1
+    rank = np.arange(len(y)) - np.searchsorted(bin_idx, bin_idx)
+
+    # alternate left (even ranks) and right (odd ranks)
+    offsets = dx * (0.5 + rank // 2)
+    offsets[rank % 2 == 1] *= -1
+
+    # the minimum falls in no (ymin, ymax] bin and stays centered
+    in_bin = bin_idx >= 0
+    x_offsets[order[in_bin]] = offsets[in_bin]
 
     return x_offsets
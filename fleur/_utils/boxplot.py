@@ -0,0 +1,53 @@
+import numpy as np
+
+
+def _box_stats(groups, whis=1.5):
+    """
+    Computes the statistics expected by `Axes.bxp()`, with the same
+    definitions as `Axes.boxplot()`: linearly interpolated quartiles and
+    whiskers reaching the most extreme values within `whis` times the
+    interquartile range, or within the `(low, high)` percentiles if `whis`
+    is a pair.
+
+    Args:
+        groups (list of array-like): The values of each group.
+        whis (float or (float, float)): Whisker length, as a multiple of the
+            interquartile range, or the percentiles reached by the whiskers.
+
+    Returns:
+        list[dict]: One dict of statistics per group.
+    """
+    percentiles_whis = np.iterable(whis)
+    percentiles = [25, 50, 75, *whis] if percentiles_whis else [25, 50, 75]
+
+    bxpstats = []
+    for values in groups:
+        values = np.asarray(values)
+
+        # np.percentile uses a partition (selection) rather than a full sort
+        q1, med, q3, *whis_bounds = np.percentile(values, percentiles)
+        iqr = q3 - q1
+        if percentiles_whis:
+            loval, hival = whis_bounds
+        else:
+            loval, hival = q1 - whis * iqr, q3 + whis * iqr
+
+        whishi = values[values <= hival].max(initial=q3)
+        whislo = values[values >= loval].min(initial=q1)
+
+        bxpstats.append(
+            {
+                "mean": values.mean(),
+                "med": med,
+                "q1": q1,
+                "q3": q3,
+                "iqr": iqr,
+                "whislo": whislo,
+                "whishi": whishi,
+                # low fliers first, in the same order as cbook.boxplot_stats()
+                "fliers": np.concatenate(
+                    [values[values < whislo], values[values > whishi]]
+                ),
+            }
+        )
+    return bxpstats
@@ -13,23 +13,26 @@ def _infer_types(x, y, df):
     Return (categorical_col, numerical_col) - Names of the identified columns
     """
 
-    def is_categorical(column_name, df):
-        col_dtype = df.schema[column_name]
+    # only dtype metadata is needed, so the schema is read once
+    schema = df.schema
+
+    def is_categorical(column_name, schema):
+        col_dtype = schema[column_name]
 
         if isinstance(col_dtype, (nw.Categorical, nw.Enum, nw.String)):
             return True
 
         return False
 
-    def is_numerical(column_name, df):
-        col_dtype = df.schema[column_name]
-        return col_dtype.is_numeric() and not is_categorical(column_name, df)
+    def is_numerical(column_name, schema):
+        return schema[column_name].is_numeric()
 
-    x_is_cat = is_categorical(x, df)
-    y_is_cat = is_categorical(y, df)
+    x_is_cat = is_categorical(x, schema)
+    y_is_cat = is_categorical(y, schema)
 
-    x_is_num = is_numerical(x, df)
-    y_is_num = is_numerical(y, df)
+    # a categorical column is never numerical: skip the dtype check
+    x_is_num = not x_is_cat and is_numerical(x, schema)
+    y_is_num = not y_is_cat and is_numerical(y, schema)
 
     if x_is_cat and y_is_num:
         return (x, y)
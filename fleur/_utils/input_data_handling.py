@@ -10,10 +10,14 @@ class _InputDataHandler:
                 raise ValueError(
                     "If x and y are strings, `data` argument must be passed."
                 )
-            if x not in data.columns or y not in data.columns:
+            columns = data.columns
+            if x not in columns or y not in columns:
                 raise ValueError("`x` and/or `y` not found in `data` columns.")
 
-            self.dataframe = nw.from_native(data)
+            if isinstance(data, nw.DataFrame):
+                self.dataframe = data
+            else:
+                self.dataframe = nw.from_native(data)
             self.x = self.dataframe[x]
             self.y = self.dataframe[y]
             self.x_name = x
@@ -22,8 +26,11 @@ class _InputDataHandler:
 
         # Case 2: x and y are Series-like
         elif is_into_series(x) and is_into_series(y):
-            self.x = nw.from_native(x, allow_series=True)
-            self.y = nw.from_native(y, allow_series=True)
+            if isinstance(x, nw.Series) and isinstance(y, nw.Series):
+                self.x, self.y = x, y
+            else:
+                self.x = nw.from_native(x, allow_series=True)
+                self.y = nw.from_native(y, allow_series=True)
             self.x_name = x.name or "x"
             self.y_name = y.name or "y"
             self.dataframe = nw.from_dict({self.x_name: self.x, self.y_name: self.y})
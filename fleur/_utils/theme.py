@@ -1,11 +1,27 @@
 import matplotlib.pyplot as plt
 import matplotlib as mpl
+from matplotlib.axes import Axes
 from cycler import cycler
 
 
+_CYCLE_COLORS_CACHE: dict = {"cycle": None, "colors": []}
+
+
+def _get_cycle_colors() -> list[str]:
+    """
+    Get the colors of the current `axes.prop_cycle`. They are cached until
+    the cycle in rcParams is replaced (including by `plt.rc_context()`).
+    """
+    cycle = plt.rcParams["axes.prop_cycle"]
+    if cycle is not _CYCLE_COLORS_CACHE["cycle"]:
+        _CYCLE_COLORS_CACHE["cycle"] = cycle
+        _CYCLE_COLORS_CACHE["colors"] = cycle.by_key()["color"]
+    return _CYCLE_COLORS_CACHE["colors"]
+
+
 def _get_first_n_colors(colors: list[str] | None, n_cat: int) -> list[str]:
     if colors is None:
-        colors: list[str] = plt.rcParams["axes.prop_cycle"].by_key()["color"][:n_cat]
+        colors: list[str] = _get_cycle_colors()[:n_cat]
     else:
         if len(colors) < n_cat:
             raise ValueError(
@@ -16,6 +32,59 @@ def _get_first_n_colors(colors: list[str] | None, n_cat: int) -> list[str]:
     return colors
 
 
+# no "axes.grid": _themify() turns on the grid for the requested axis only
+_THEME_RC: dict = {
+    "axes.axisbelow": True,
+    "grid.color": "#525252",
+    "grid.alpha": 0.2,
+    "axes.spines.top": False,
+    "axes.spines.right": False,
+    "axes.spines.left": False,
+    "axes.spines.bottom": False,
+    "xtick.major.size": 0,
+    "ytick.major.size": 0,
+    "xtick.labelsize": 8,
+    "ytick.labelsize": 8,
+}
+
+
+def themify_context():
+    """
+    Context manager applying the fleur theme through rcParams, so that
+    Axes created inside it are already themed. Useful when drawing many
+    plots in a row.
+
+    Returns:
+        A `matplotlib.rc_context()`.
+    """
+    return plt.rc_context(_THEME_RC)
+
+
+def _themify(ax: Axes, grid_axis: str = "both") -> Axes:
+    """
+    Set the theme to a matplotlib Axes.
+
+    Args
+        ax: The matplotlib Axes to which you want to apply the theme.
+        grid_axis: The axis on which to draw the grid: "both", "x" or "y".
+
+    Returns
+        The matplotlib Axes.
+    """
+    ax.grid(
+        axis=grid_axis,
+        color=_THEME_RC["grid.color"],
+        alpha=_THEME_RC["grid.alpha"],
+        zorder=-5,
+    )
+    spines = ax.spines
+    # axes created within themify_context() already have hidden spines
+    if any(spine.get_visible() for spine in spines.values()):
+        spines[["top", "right", "left", "bottom"]].set_visible(False)
+    ax.tick_params(size=0, labelsize=_THEME_RC["xtick.labelsize"])
+    return ax
+
+
 def set_rcParams():
     params = {
         "axes.prop_cycle": cycler(
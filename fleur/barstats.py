@@ -3,12 +3,11 @@ from matplotlib.figure import Figure
 from matplotlib.axes import Axes
 import narwhals as nw
 import numpy as np
-import scipy.stats as st
 
 from typing import Iterable, Any
 from narwhals.typing import SeriesT, Frame
 
-from fleur._utils import _InputDataHandler, _get_first_n_colors
+from fleur._utils import _InputDataHandler, _get_first_n_colors, _themify
 
 
 class BarStats:
@@ -112,6 +111,8 @@ class BarStats:
                 "freq" (default) or "bayes".
             kwargs: Additional arguments passed to the scipy test function.
         """
+        from scipy import stats as st
+
         if approach == "freq":
             if self.is_paired:
                 # if binary (2 levels) variable, use McNemar's test
@@ -228,7 +229,7 @@ class BarStats:
         if bar_kws is None:
             bar_kws: dict = {}
 
-        ax: Axes = self._themify(ax, orientation)
+        ax: Axes = _themify(ax, grid_axis="x" if orientation == "horizontal" else "y")
 
         colors: list[str] = _get_first_n_colors(colors, self.n_levels)
 
@@ -348,22 +349,3 @@ class BarStats:
                     label=y_level,
                     **bar_kws,
                 )
-
-    def _themify(self, ax: Axes, orientation: str) -> Axes:
-        """
-        Set the theme to a matplotlib Axes.
-
-        Args
-            ax: The matplotlib Axes to which you want to apply the theme.
-
-        Returns
-            The matplotlib Axes.
-        """
-        grid_params: dict = dict(color="#525252", alpha=0.2, zorder=-5)
-        if orientation == "horizontal":
-            ax.grid(axis="x", **grid_params)
-        else:
-            ax.grid(axis="y", **grid_params)
-        ax.spines[["top", "right", "left", "bottom"]].set_visible(False)
-        ax.tick_params(size=0, labelsize=8)
-        return ax
@@ -1,22 +1,51 @@
 import matplotlib.pyplot as plt
-import scipy.stats as st
 import numpy as np
 
 from matplotlib.axes import Axes
 from matplotlib.figure import Figure
 from matplotlib.collections import PolyCollection
+from matplotlib.colors import to_rgba_array
 from typing import Iterable, Any, cast
 from narwhals.typing import SeriesT, Frame
 
 from ._utils import (
     _infer_types,
     _beeswarm,
+    _box_stats,
+    _violin_stats,
     _InputDataHandler,
     _get_first_n_colors,
+    _themify,
 )
 
+import inspect
 import warnings
 
+# box_kws that bxp() accepts with the same meaning as boxplot(); any other
+# argument (notch, bootstrap, usermedians, ...) is left to boxplot(). Notch
+# bounds are not computed by _box_stats(), hence shownotches is excluded.
+_BXP_KWS: frozenset[str] = frozenset(inspect.signature(Axes.bxp).parameters) - {
+    "self",
+    "bxpstats",
+    "shownotches",
+}
+
+# rcParams read by boxplot() for the bxp() arguments that are not passed
+_BXP_RC_DEFAULTS: dict[str, str] = {
+    "showfliers": "boxplot.showfliers",
+    "showmeans": "boxplot.showmeans",
+    "showcaps": "boxplot.showcaps",
+    "showbox": "boxplot.showbox",
+    "meanline": "boxplot.meanline",
+}
+
+# violin_kws that violin() accepts with the same meaning as violinplot(); any
+# other argument (bw_method, quantiles, ...) is left to violinplot()
+_VIOLIN_KWS: frozenset[str] = frozenset(inspect.signature(Axes.violin).parameters) - {
+    "self",
+    "vpstats",
+}
+
 
 class BetweenStats:
     """
@@ -83,11 +112,17 @@ class BetweenStats:
         cat_col, num_col = _infer_types(x_name, y_name, df)
         self._cat_col = cat_col
         self._num_col = num_col
-        self._result = [sub_df[num_col].to_list() for _, sub_df in df.group_by(cat_col)]
-        self._sample_sizes = [len(sub_df) for _, sub_df in df.group_by(cat_col)]
-        self._cat_labels = df[cat_col].unique().to_list()
-        self.n_cat = df[cat_col].n_unique()
-        self.n_obs = len(df)
+
+        # single pass over the groups, so that values, sizes and labels
+        # are computed once and always in the same order
+        self._result, self._sample_sizes, self._cat_labels = [], [], []
+        for (label,), sub_df in df.group_by(cat_col):
+            values = sub_df[num_col].to_numpy()
+            self._result.append(values)
+            self._sample_sizes.append(len(values))
+            self._cat_labels.append(label)
+        self.n_cat = len(self._result)
+        self.n_obs = sum(self._sample_sizes)
         self.means = [np.mean(group) for group in self._result]
 
         self._fit(approach=approach, **kwargs)
@@ -104,6 +139,8 @@ class BetweenStats:
                 Either `scipy.stats.ttest_rel()`, `scipy.stats.ttest_ind()`,
                 or `scipy.stats.f_oneway()`.
         """
+        from scipy import stats as st
+
         if "trim" in kwargs and approach != "robust":
             warnings.warn(
                 'Using `trim` argument without expliciting `approach="robust"` is not recommended.'
@@ -239,6 +276,11 @@ class BetweenStats:
             "$",
         ]
         self._expression = "".join(expr_list)
+        self._expression_plain = (
+            f"{self._letter}_{self.name} = {self.statistic:.2f}, "
+            f"p = {self.pvalue:.4f}, "
+            f"n_obs = {self.n_obs}"
+        )
 
     def plot(
         self,
@@ -246,6 +288,7 @@ class BetweenStats:
         orientation: str = "vertical",
         colors: list | None = None,
         show_stats: bool = True,
+        mathtext: bool = True,
         show_means: bool = True,
         jitter_amount: float = 0.25,
         violin: bool = True,
@@ -272,6 +315,9 @@ class BetweenStats:
             orientation: 'vertical' or 'horizontal' orientation of plots.
             colors: List of colors for each group.
             show_stats: If True, adds statistics on the plot.
+            mathtext: If True, statistics and mean labels are rendered with
+                matplotlib's mathtext. If False, they are rendered as plain
+                text, which is faster to draw.
             show_means: If True, adds mean labels on the plot.
             jitter_amount: Controls the horizontal spread of dots to prevent
                 overlap; 0 aligns them, higher values increase spacing.
@@ -311,7 +357,15 @@ class BetweenStats:
         scatter_default_kws.update(scatter_kws)
 
         if violin:
-            violin_artists: dict = ax.violinplot(self._result, **violin_default_kws)
+            points: int = violin_default_kws.pop("points", 100)
+            if _VIOLIN_KWS.issuperset(violin_default_kws):
+                violin_artists: dict = ax.violin(
+                    _violin_stats(self._result, points=points), **violin_default_kws
+                )
+            else:
+                violin_artists: dict = ax.violinplot(
+                    self._result, points=points, **violin_default_kws
+                )
             bodies: list[PolyCollection] = cast(
                 list[PolyCollection], violin_artists["bodies"]
             )
@@ -319,27 +373,51 @@ class BetweenStats:
                 patch.set(color=color)
 
         if box:
-            box_style: dict = {"color": "#3b3b3b"}
-            ax.boxplot(
-                self._result,
-                boxprops=box_style,
-                medianprops=box_style,
-                capprops=box_style,
-                whiskerprops=box_style,
-                **box_default_kws,
+            # one dict per artist type: boxplot() rewrites boxprops in place
+            # when patch_artist is on
+            box_style_kws: dict = {
+                props: {"color": "#3b3b3b"}
+                for props in ["boxprops", "medianprops", "capprops", "whiskerprops"]
+            }
+            whis = box_default_kws.pop("whis", None)
+            if whis is None:
+                whis = plt.rcParams["boxplot.whiskers"]
+            # notches, bootstrapped medians and patch boxes (whose props are
+            # rewritten by boxplot()) are left to boxplot()
+            use_bxp: bool = (
+                _BXP_KWS.issuperset(box_default_kws)
+                and not box_default_kws.get(
+                    "patch_artist", plt.rcParams["boxplot.patchartist"]
+                )
+                and not plt.rcParams["boxplot.notch"]
+                and plt.rcParams["boxplot.bootstrap"] is None
             )
+            if use_bxp:
+                for name, rc_name in _BXP_RC_DEFAULTS.items():
+                    box_default_kws.setdefault(name, plt.rcParams[rc_name])
+                ax.bxp(
+                    _box_stats(self._result, whis=whis),
+                    **box_style_kws,
+                    **box_default_kws,
+                )
+            else:
+                ax.boxplot(self._result, whis=whis, **box_style_kws, **box_default_kws)
 
         if scatter:
-            for i, (values, label, color) in enumerate(
-                zip(self._result, self._cat_labels, colors)
-            ):
-                x_offsets = _beeswarm(values, width=jitter_amount)
-                x_coords = np.full(len(values), i + 1) + x_offsets
+            # all groups are drawn in a single collection
+            x_all = np.repeat(np.arange(1.0, self.n_cat + 1), self._sample_sizes)
+            stops = np.cumsum(self._sample_sizes)
+            for values, stop in zip(self._result, stops):
+                x_all[stop - len(values) : stop] += _beeswarm(values, jitter_amount)
+            y_all = np.concatenate(self._result)
+            colors_all = np.repeat(
+                to_rgba_array(colors[: self.n_cat]), self._sample_sizes, axis=0
+            )
 
-                if orientation == "vertical":
-                    ax.scatter(x_coords, values, color=color, **scatter_default_kws)
-                else:  # "horizontal"
-                    ax.scatter(values, x_coords, color=color, **scatter_default_kws)
+            if orientation == "vertical":
+                ax.scatter(x_all, y_all, color=colors_all, **scatter_default_kws)
+            else:  # "horizontal"
+                ax.scatter(y_all, x_all, color=colors_all, **scatter_default_kws)
 
         if show_means:
             mean_scatter_kwargs: dict = dict(color="#c1121f", s=100, zorder=50)
@@ -351,26 +429,28 @@ class BetweenStats:
 
         if show_stats:
             annotation_params: dict = dict(transform=ax.transAxes, va="top")
-            ax.text(x=0.05, y=1.09, s=self._expression, size=9, **annotation_params)
+            expression = self._expression if mathtext else self._expression_plain
+            ax.text(x=0.05, y=1.09, s=expression, size=9, **annotation_params)
 
-        ax: Axes = self._themify(ax)
+        ax: Axes = _themify(ax)
 
-        ticks: list[int] = [i + 1 for i in range(len(self._sample_sizes))]
+        ticks: np.ndarray = np.arange(1, self.n_cat + 1)
         labels: list[str] = [
-            f"{label}\nn = {n}"
-            for n, label in zip(self._sample_sizes, self._cat_labels)
+            f"{label}\nn = {size}"
+            for size, label in zip(self._sample_sizes, self._cat_labels)
         ]
-        if orientation == "vertical":
-            ax.set_xticks(ticks, labels=labels)
-        elif orientation == "horizontal":
-            ax.set_yticks(ticks, labels=labels)
+        set_ticks = ax.set_xticks if orientation == "vertical" else ax.set_yticks
+        set_ticks(ticks, labels=labels)
 
         self.ax = ax
 
         if show_means:
             shift = 1.3
             for i, mean in enumerate(self.means):
-                label = f"$\\hat{{\\mu}}_{{mean}} = {mean:.2f}$"
+                if mathtext:
+                    label = f"$\\hat{{\\mu}}_{{mean}} = {mean:.2f}$"
+                else:
+                    label = f"mean = {mean:.2f}"
                 if orientation == "vertical":
                     ax.text(
                         x=i + shift,
@@ -393,18 +473,3 @@ class BetweenStats:
                     ax.plot([mean, mean], [i + 1, i + shift], **mean_line_kws)
 
         return plt.gcf()
-
-    def _themify(self, ax: Axes) -> Axes:
-        """
-        Set the theme to a matplotlib Axes.
-
-        Args
-            ax: The matplotlib Axes to which you want to apply the theme.
-
-        Returns
-            The matplotlib Axes.
-        """
-        ax.grid(color="#525252", alpha=0.2, zorder=-5)
-        ax.spines[["top", "right", "left", "bottom"]].set_visible(False)
-        ax.tick_params(size=0, labelsize=8)
-        return ax
@@ -1,11 +1,12 @@
 import narwhals as nw
+import csv
 import os
 
-from typing import List
+from functools import lru_cache
 from narwhals.typing import Frame
 
 PACKAGE_DIR: str = os.path.dirname(os.path.abspath(__file__))
-AVAILABLE_DATASETS: List[str] = ["iris", "mtcars", "titanic"]
+AVAILABLE_DATASETS: list[str] = ["iris", "mtcars", "titanic"]
 
 
 def _load_data(dataset_name: str, backend: str) -> Frame:
@@ -26,11 +27,51 @@ def _load_data(dataset_name: str, backend: str) -> Frame:
             f"dataset_name must be one of: {' ,'.join(AVAILABLE_DATASETS)}"
         )
 
+    # the cached frame is shared, so callers get their own copy
+    return _read_dataset(dataset_name, backend).clone().to_native()
+
+
+@lru_cache(maxsize=None)
+def _read_dataset(dataset_name: str, backend: str) -> nw.DataFrame:
+    """
+    Parse the csv file of a dataset. Results are cached, so each dataset
+    is read at most once per backend.
+
+    Args:
+        dataset_name: A string specifying the name of the dataset.
+        backend: The backend of the dataframe.
+    Returns:
+        A narwhals dataframe with the specified dataset.
+    """
+    if dataset_name == "iris":
+        # small enough to be built from memory for any backend
+        return nw.from_dict(_iris_columns(), backend=backend)
+
     dataset_file: str = f"{dataset_name}.csv"
     dataset_path: str = os.path.join(PACKAGE_DIR, dataset_file)
-    df: Frame = nw.read_csv(dataset_path, backend=backend)
+    return nw.read_csv(dataset_path, backend=backend)
+
+
+@lru_cache(maxsize=1)
+def _iris_columns() -> dict[str, list]:
+    """
+    Read the iris dataset once into plain Python columns, shared by all
+    backends.
 
-    return df.to_native()
+    Returns:
+        A dict mapping column names to lists of values.
+    """
+    with open(os.path.join(PACKAGE_DIR, "iris.csv"), newline="") as f:
+        rows: list[list[str]] = list(csv.reader(f))
+
+    header, records = rows[0], rows[1:]
+    columns: dict[str, list] = {
+        name: list(values) for name, values in zip(header, zip(*records))
+    }
+    for name in header:
+        if name != "species":
+            columns[name] = [float(value) for value in columns[name]]
+    return columns
 
 
 def load_iris(output_format: str = "pandas") -> Frame:
@@ -1,16 +1,171 @@
 import matplotlib.pyplot as plt
 from matplotlib.figure import Figure
 from matplotlib.axes import Axes
-import scipy.stats as st
 import numpy as np
 
-from typing import Iterable, Literal
+from functools import lru_cache
+from typing import Iterable, Literal, NamedTuple
 from narwhals.typing import SeriesT, Frame
 
-from fleur._utils import _count_n_decimals, _InputDataHandler
+from fleur._utils import (
+    _count_n_decimals,
+    _InputDataHandler,
+    _get_cycle_colors,
+    _themify,
+)
 
+import threading
 import warnings
 
+N_BAND: int = 64  # number of points used to draw the regression line and band
+
+_EXPRESSION_TEMPLATE: str = (
+    "$"
+    "t_{{Student}}({dof}) = {slope:.2f}, "
+    "CI_{{{ci:.{ci_decimal}f}\\%}} = [{ci_lower:.2f}, {ci_upper:.2f}], "
+    "p = {pvalue:.4f}, "
+    "{symbol}_{{{effect_size}}} = {correlation:.2f}, "
+    "n_{{obs}} = {n_obs}"
+    "$"
+)
+_EXPRESSION_MODEL_TEMPLATE: str = (
+    "$\\hat{{y}}_i = {intercept:.2f} {sign} {abs_slope:.2f}x_i$"
+)
+_EXPRESSION_PLAIN_TEMPLATE: str = (
+    "t_Student({dof}) = {slope:.2f}, "
+    "CI_{ci:.{ci_decimal}f}% = [{ci_lower:.2f}, {ci_upper:.2f}], "
+    "p = {pvalue:.4f}, "
+    "{symbol}_{effect_size} = {correlation:.2f}, "
+    "n_obs = {n_obs}"
+)
+_EXPRESSION_MODEL_PLAIN_TEMPLATE: str = "y = {intercept:.2f} {sign} {abs_slope:.2f}x"
+
+
+class _Regression(NamedTuple):
+    slope: float
+    intercept: float
+    rvalue: float
+    pvalue: float
+    stderr: float
+    x_mean: float
+    x_var: float  # sum of squared deviations of x
+
+
+def _linregress(x: np.ndarray, y: np.ndarray, alternative: str) -> _Regression:
+    """
+    Same results as `scipy.stats.linregress()` on two contiguous float64
+    arrays, computed from two dot products on the centered values and a
+    single evaluation of the Student's t distribution.
+    """
+    from scipy import special
+
+    n = x.shape[0]
+    if n > 1 and x.max() == x.min():
+        raise ValueError(
+            "Cannot calculate a linear regression if all x values are identical"
+        )
+
+    x_mean, y_mean = x.mean(), y.mean()
+    # O(n) temporaries are not pooled, so they are freed with the fit
+    x_centered = x - x_mean
+    y_centered = y - y_mean
+    x_var = np.dot(x_centered, x_centered)
+    y_var = np.dot(y_centered, y_centered)
+    xy_cov = np.dot(x_centered, y_centered)
+
+    slope = xy_cov / x_var
+    intercept = y_mean - slope * x_mean
+    if y_var == 0.0:
+        rvalue = 0.0
+    else:
+        rvalue = min(max(xy_cov / np.sqrt(x_var * y_var), -1.0), 1.0)
+
+    if n == 2:
+        # a line always goes through two points
+        pvalue = 1.0 if y[0] == y[1] else 0.0
+        stderr = 0.0
+    else:
+        dof = n - 2
+        tiny = 1.0e-20  # same guard as scipy against |r| = 1
+        t_statistic = rvalue * np.sqrt(
+            dof / ((1 - rvalue + tiny) * (1 + rvalue + tiny))
+        )
+        if alternative == "two-sided":
+            pvalue = 2 * special.stdtr(dof, -abs(t_statistic))
+        elif alternative == "less":
+            pvalue = special.stdtr(dof, t_statistic)
+        else:  # greater
+            pvalue = special.stdtr(dof, -t_statistic)
+        stderr = np.sqrt((1 - rvalue**2) * y_var / x_var / dof)
+
+    return _Regression(slope, intercept, rvalue, pvalue, stderr, x_mean, x_var)
+
+
+def _pearson(regression, x: np.ndarray, y: np.ndarray) -> float:
+    """Pearson's r, which is a by-product of the regression."""
+    return regression.rvalue
+
+
+def _kendall(regression, x: np.ndarray, y: np.ndarray) -> float:
+    """Kendall's tau."""
+    from scipy import stats as st
+
+    # only the statistic is used: skip the exact p-value of small samples
+    return st.kendalltau(x, y, method="asymptotic").statistic
+
+
+def _spearman(regression, x: np.ndarray, y: np.ndarray) -> float:
+    """Spearman's rho, computed as Pearson's r on the ranks."""
+    from scipy import stats as st
+
+    return np.corrcoef(st.rankdata(x), st.rankdata(y))[0, 1]
+
+
+_BUFFERS = threading.local()
+
+
+def _get_buffer(name: str, n: int) -> np.ndarray:
+    """
+    Return a float64 scratch buffer of length `n`, reused across calls
+    within a thread. Its content must not outlive the caller, so it is
+    never handed to matplotlib artists. Pooled buffers are never released,
+    so only small buffers of a fixed size (e.g. `N_BAND`) may come from here.
+    """
+    buffers: dict = _BUFFERS.__dict__
+    buffer = buffers.get(name)
+    if buffer is None or buffer.shape != (n,):
+        buffer = buffers[name] = np.empty(n, dtype=np.float64)
+    return buffer
+
+
+@lru_cache(maxsize=128)
+def _t_ppf(q: float, dof: int) -> float:
+    """Quantile of the Student's t distribution, cached per (q, dof)."""
+    from scipy import stats as st
+
+    return st.t.ppf(q, dof)
+
+
+def _bin_edges(lower: float, upper: float, bins):
+    """
+    Compute the same edges as `np.histogram()` for an integer number of
+    bins, from already known extrema. Other `bins` values are returned as is.
+    """
+    if not isinstance(bins, (int, np.integer)):
+        return bins
+    if lower == upper:
+        lower, upper = lower - 0.5, upper + 0.5
+    return np.linspace(lower, upper, bins + 1)
+
+
+_ALTERNATIVES: frozenset = frozenset(("two-sided", "less", "greater"))
+
+_CORREL_DISPATCH: dict = {
+    "pearson": (_pearson, "\\rho", "ρ"),
+    "kendall": (_kendall, "\\tau", "τ"),
+    "spearman": (_spearman, "\\rho", "ρ"),
+}
+
 
 class ScatterStats:
     """
@@ -39,6 +194,7 @@ class ScatterStats:
         alternative: str = "two-sided",
         effect_size: str = "pearson",
         ci: int | float = 95,
+        stats: bool = True,
     ):
         """
         Initialize a `ScatterStats()` instance.
@@ -55,11 +211,18 @@ class ScatterStats:
             ci: Confidence level for the label and the regression
                 plot. The default value is 95 (for a 95% confidence
                 level).
+            stats: Whether to compute the statistics. If False, only
+                `slope` and `intercept` are estimated (without SciPy), and
+                the plot has neither the confidence area nor the statistics.
         """
-        if effect_size not in ["pearson", "kendall", "spearman"]:
+        if effect_size not in _CORREL_DISPATCH:
             raise ValueError(
                 "effect_size argument must be one of: 'pearson', 'kendall', 'spearman'."
             )
+        if alternative not in _ALTERNATIVES:
+            raise ValueError(
+                "alternative argument must be one of: 'two-sided', 'less', 'greater'."
+            )
 
         self._data_info = _InputDataHandler(x=x, y=y, data=data).get_info()
 
@@ -67,69 +230,80 @@ class ScatterStats:
         y_name: str = self._data_info["y_name"]
         df = self._data_info["dataframe"]
 
-        self._x_np = df[x_name].to_numpy()
-        self._y_np = df[y_name].to_numpy()
-        self.n_obs = len(df)
+        self._x_np = np.ascontiguousarray(df[x_name].to_numpy(), dtype=np.float64)
+        self._y_np = np.ascontiguousarray(df[y_name].to_numpy(), dtype=np.float64)
+        self.n_obs = self._x_np.shape[0]
 
-        self._fit(alternative=alternative, effect_size=effect_size, ci=ci)
+        self._has_stats = stats
+        if stats:
+            self._fit(alternative=alternative, effect_size=effect_size, ci=ci)
+        else:
+            # same guard as _linregress(): polyfit would only warn
+            if self._x_np.max() == self._x_np.min():
+                raise ValueError(
+                    "Cannot calculate a linear regression if all x values are identical"
+                )
+            self.slope, self.intercept = np.polyfit(self._x_np, self._y_np, 1)
 
     def _fit(self, alternative: str, effect_size: str, ci: int | float):
-        regression = st.linregress(self._x_np, self._y_np, alternative=alternative)
+        regression = _linregress(self._x_np, self._y_np, alternative=alternative)
 
         self.alpha = 1 - ci / 100
         self.dof = self.n_obs - 2
 
-        if effect_size == "pearson":
-            correlation_output: float = st.pearsonr(
-                self._x_np, self._y_np, alternative=alternative
-            )
-            self._symbol_correl = "\\rho"
-        elif effect_size == "kendall":
-            correlation_output: float = st.kendalltau(
-                self._x_np, self._y_np, alternative=alternative
-            )
-            self._symbol_correl = "\\tau"
-        elif effect_size == "spearman":
-            correlation_output: float = st.spearmanr(
-                self._x_np, self._y_np, alternative=alternative
-            )
-            self._symbol_correl = "\\rho"
+        dispatch: tuple = _CORREL_DISPATCH[effect_size]
+        correlation_function, self._symbol_correl, symbol_plain = dispatch
+        self.correlation = correlation_function(regression, self._x_np, self._y_np)
 
-        self.correlation = correlation_output.statistic
         self.pvalue = regression.pvalue
         self.intercept = regression.intercept
         self.slope = regression.slope
         self.stderr_slope = regression.stderr
-        self._t_critical = st.t.ppf(1 - self.alpha / 2, self.dof)
+        self._t_critical = _t_ppf(1 - self.alpha / 2, self.dof)
         self.ci_lower = self.slope - self._t_critical * self.stderr_slope
         self.ci_upper = self.slope + self._t_critical * self.stderr_slope
 
+        # OLS by-products for the confidence band: since
+        # stderr_slope = rse / sqrt(x_var), no residuals array is needed
+        self._x_mean = regression.x_mean
+        self._x_var = regression.x_var
+        self._rse = self.stderr_slope * np.sqrt(self._x_var)
+
         ci_decimal: int = _count_n_decimals(ci)
 
-        expr_list: list[str] = [
-            "$",
-            f"t_{{Student}}({self.dof}) = {self.slope:.2f}, ",
-            f"CI_{{{ci:.{ci_decimal}f}\\%}} = [{self.ci_lower:.2f}, {self.ci_upper:.2f}], ",
-            f"p = {self.pvalue:.4f}, ",
-            f"{self._symbol_correl}_{{{effect_size.title()}}} = {self.correlation:.2f}, ",
-            f"n_{{obs}} = {self.n_obs}",
-            "$",
-        ]
-        self._expression = "".join(expr_list)
-
-        expr_list: list[str] = [
-            "$",
-            f"\\hat{{y}}_i = {self.intercept:.2f}",
-            f" {'+' if self.slope >= 0 else '-'} ",
-            f"{abs(self.slope):.2f}x_i",
-            "$",
-        ]
-        self._expression_model = "".join(expr_list)
+        expression_values: dict = dict(
+            dof=self.dof,
+            slope=self.slope,
+            ci=ci,
+            ci_decimal=ci_decimal,
+            ci_lower=self.ci_lower,
+            ci_upper=self.ci_upper,
+            pvalue=self.pvalue,
+            effect_size=effect_size.title(),
+            correlation=self.correlation,
+            n_obs=self.n_obs,
+        )
+        self._expression = _EXPRESSION_TEMPLATE.format(
+            symbol=self._symbol_correl, **expression_values
+        )
+        self._expression_plain = _EXPRESSION_PLAIN_TEMPLATE.format(
+            symbol=symbol_plain, **expression_values
+        )
+
+        model_values: dict = dict(
+            intercept=self.intercept,
+            sign="+" if self.slope >= 0 else "-",
+            abs_slope=abs(self.slope),
+        )
+        self._expression_model = _EXPRESSION_MODEL_TEMPLATE.format(**model_values)
+        self._expression_model_plain = _EXPRESSION_MODEL_PLAIN_TEMPLATE.format(
+            **model_values
+        )
 
     def plot(
         self,
         *,
-        bins: int | list[int] | None = None,
+        bins: int | list[int] | tuple[int, int] | None = None,
         hist: bool = True,
         scatter: bool = True,
         line: bool = True,
@@ -140,13 +314,14 @@ class ScatterStats:
         hist_kws: dict | None = None,
         subplot_mosaic_kwargs: dict | None = None,
         show_stats: bool = True,
+        mathtext: bool = True,
     ) -> Figure:
         r"""
         Plot a scatter plot of two variables, with a linear regression
         line and annotate it with main statistical results.
 
         Args:
-            bins: Number of bins for the marginal distributions. This can be an integer or a list of two integers (the first for the top distribution and the second for the other).
+            bins: Number of bins for the marginal distributions. This can be an integer or a list/tuple of two integers (the first for the top distribution and the second for the other).
             hist: Whether to include histograms of marginal distributions.
             scatter: Whether to include the scatter plot.
             line: Whether to include the line of the regression.
@@ -157,6 +332,9 @@ class ScatterStats:
             hist_kws: Additional parameters which will be passed to the `hist()` function in matplotlib.
             subplot_mosaic_kwargs: Additional keyword arguments to pass to `plt.subplot_mosaic()`. Default is `None`.
             show_stats: If True, display statistics on the plot.
+            mathtext: If True, statistics are rendered with matplotlib's
+                mathtext. If False, they are rendered as plain text, which
+                is faster to draw.
         """
         if not hist and any([bins is not None, hist_kws is not None]):
             warnings.warn(
@@ -192,25 +370,31 @@ class ScatterStats:
             line_kws: dict = {}
         if area_kws is None:
             area_kws: dict = {}
-        area_default_kws: dict = {
-            "color": plt.rcParams["axes.prop_cycle"].by_key()["color"][0],
-            "alpha": 0.2,
-        }
+        area_default_kws: dict = {"alpha": 0.2}
         area_default_kws.update(area_kws)
 
-        x_values = np.linspace(np.min(self._x_np), np.max(self._x_np), 100)
+        if not self._has_stats:
+            # the confidence area and the annotations need the statistics
+            area = show_stats = False
+
+        x_min, x_max = self._x_np.min(), self._x_np.max()
+        x_values = np.linspace(x_min, x_max, N_BAND)
         y_values = self.slope * x_values + self.intercept
-        residuals = self._y_np - (self.slope * self._x_np + self.intercept)
-        rse = np.sqrt(np.sum(residuals**2) / self.dof)
-        x_mean = np.mean(self._x_np)
-        x_var = np.sum((self._x_np - x_mean) ** 2)
-        y_err = (
-            self._t_critical
-            * rse
-            * np.sqrt(1 / self.n_obs + (x_values - x_mean) ** 2 / x_var)
-        )
 
         if area:
+            if "color" not in area_default_kws:
+                area_default_kws["color"] = _get_cycle_colors()[0]
+
+            # t * rse * sqrt(1/n + (x - x_mean)^2 / x_var), computed in place
+            y_err = np.subtract(
+                x_values, self._x_mean, out=_get_buffer("y_err", N_BAND)
+            )
+            np.multiply(y_err, y_err, out=y_err)
+            y_err /= self._x_var
+            y_err += 1 / self.n_obs
+            np.sqrt(y_err, out=y_err)
+            y_err *= self._t_critical * self._rse
+
             ax.fill_between(
                 x_values,
                 y_values - y_err,
@@ -222,7 +406,7 @@ class ScatterStats:
         if line:
             ax.plot(x_values, y_values, **line_kws)
 
-        ax: Axes = self._themify(ax)
+        ax: Axes = _themify(ax)
 
         if hist:
             if bins is None:
@@ -231,12 +415,17 @@ class ScatterStats:
             if hist_kws is None:
                 hist_kws: dict = {}
 
-            if isinstance(bins, list):
+            if isinstance(bins, (list, tuple)):
                 binsB: int = bins[0]
                 binsC: int = bins[1]
             else:
                 binsB = binsC = bins
 
+            if "range" not in hist_kws:
+                # reuse the extrema instead of letting np.histogram rescan the data
+                binsB = _bin_edges(x_min, x_max, binsB)
+                binsC = _bin_edges(self._y_np.min(), self._y_np.max(), binsC)
+
             axs["B"].hist(self._x_np, bins=binsB, **hist_kws)
             axs["C"].hist(self._y_np, orientation="horizontal", bins=binsC, **hist_kws)
 
@@ -245,11 +434,17 @@ class ScatterStats:
 
         if show_stats:
             annotation_params: dict = dict(transform=fig.transFigure, va="top")
-            fig.text(x=0.1, y=0.95, s=self._expression, size=9, **annotation_params)
+            if mathtext:
+                expression = self._expression
+                expression_model = self._expression_model
+            else:
+                expression = self._expression_plain
+                expression_model = self._expression_model_plain
+            fig.text(x=0.1, y=0.95, s=expression, size=9, **annotation_params)
             fig.text(
                 x=0.75,
                 y=0.05,
-                s=self._expression_model,
+                s=expression_model,
                 ha="right",
                 weight="bold",
                 style="normal",
@@ -259,17 +454,87 @@ class ScatterStats:
 
         return self.fig
 
-    def _themify(self, ax: Axes) -> Axes:
-        """
-        Set the theme to a matplotlib Axes.
 
-        Args
-            ax: The matplotlib Axes to which you want to apply the theme.
+def scatterstats_batch(
+    x: Iterable,
+    y: Iterable,
+    alternative: str = "two-sided",
+    ci: int | float = 95,
+) -> dict[str, np.ndarray]:
+    """
+    Fit the `ScatterStats()` regression on many (x, y) pairs at once.
+
+    Each pair is stored along the last axis of `x` and `y`, so for instance
+    two arrays of shape `(n_pairs, n_obs)` give `n_pairs` regressions.
+    All the pairs are fitted with the same vectorized reductions instead of
+    one `scipy.stats.linregress()` call per pair.
+
+    Args:
+        x: Array-like of shape `(..., n_obs)`.
+        y: Array-like broadcastable with `x`.
+        alternative: Defines the alternative hypothesis. Default
+            is 'two-sided'. Must be one of 'two-sided', 'less' and 'greater'.
+        ci: Confidence level for the confidence interval of the slope. The
+            default value is 95 (for a 95% confidence level).
+
+    Returns:
+        A dict of arrays of shape `x.shape[:-1]`, with the keys "slope",
+            "intercept", "stderr_slope", "correlation" (Pearson), "pvalue",
+            "ci_lower" and "ci_upper".
+    """
+    from scipy import stats as st
 
-        Returns
-            The matplotlib Axes.
-        """
-        ax.grid(color="#525252", alpha=0.2, zorder=-5)
-        ax.spines[["top", "right", "left", "bottom"]].set_visible(False)
-        ax.tick_params(size=0, labelsize=8)
-        return ax
+    if alternative not in _ALTERNATIVES:
+        raise ValueError(
+            "alternative argument must be one of: 'two-sided', 'less', 'greater'."
+        )
+
+    x, y = np.broadcast_arrays(
+        np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64)
+    )
+    if x.ndim == 0 or x.shape[-1] < 3:
+        raise ValueError("Each (x, y) pair must have at least 3 observations.")
+    if np.any(x.max(axis=-1) == x.min(axis=-1)):
+        raise ValueError(
+            "Cannot calculate a linear regression if all x values are identical"
+        )
+    dof = x.shape[-1] - 2
+
+    x_mean = x.mean(axis=-1, keepdims=True)
+    y_mean = y.mean(axis=-1, keepdims=True)
+    dx = x - x_mean
+    dy = y - y_mean
+    x_var = np.einsum("...i,...i->...", dx, dx)
+    y_var = np.einsum("...i,...i->...", dy, dy)
+    xy_cov = np.einsum("...i,...i->...", dx, dy)
+
+    slope = xy_cov / x_var
+    intercept = y_mean[..., 0] - slope * x_mean[..., 0]
+    # a constant y gives xy_cov = 0, hence no correlation like in _linregress()
+    scale = np.sqrt(x_var * y_var)
+    correlation = np.clip(xy_cov / np.where(scale > 0, scale, 1.0), -1.0, 1.0)
+    stderr_slope = np.sqrt((1 - correlation**2) * y_var / x_var / dof)
+
+    # t = slope / stderr_slope, with the same guard as scipy against |r| = 1
+    tiny = 1.0e-20
+    t_statistic = correlation * np.sqrt(
+        dof / ((1 - correlation + tiny) * (1 + correlation + tiny))
+    )
+    if alternative == "two-sided":
+        pvalue = 2 * st.t.sf(np.abs(t_statistic), dof)
+    elif alternative == "less":
+        pvalue = st.t.cdf(t_statistic, dof)
+    else:  # greater
+        pvalue = st.t.sf(t_statistic, dof)
+
+    t_critical = _t_ppf(1 - (1 - ci / 100) / 2, dof)
+
+    return {
+        "slope": slope,
+        "intercept": intercept,
+        "stderr_slope": stderr_slope,
+        "correlation": correlation,
+        "pvalue": pvalue,
+        "ci_lower": slope - t_critical * stderr_slope,
+        "ci_upper": slope + t_critical * stderr_slope,
+    }
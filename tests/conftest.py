@@ -0,0 +1,22 @@
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt  # noqa: E402
+import pytest  # noqa: E402
+
+# a user matplotlibrc may turn interactive mode on, which redraws after each call
+plt.ioff()
+
+
+@pytest.fixture(autouse=True)
+def _close_figures():
+    # also covers figures created implicitly, e.g. by plot(ax=None)
+    yield
+    plt.close("all")
+
+
+@pytest.fixture
+def ax():
+    _, ax = plt.subplots()
+    return ax
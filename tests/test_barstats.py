@@ -1,4 +1,5 @@
 import pytest
+import itertools
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.figure import Figure
@@ -8,13 +9,17 @@ from fleur.barstats import BarStats
 import fleur.data as data
 
 
-@pytest.fixture
+# smallest valid input, for tests that only reach argument validation
+TINY_DATA = pl.DataFrame({"cyl": [4, 6], "vs": [0, 1]})
+
+
+@pytest.fixture(scope="session")
 def sample_data():
     df = data.load_mtcars()
     return df
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_data2():
     df = data.load_iris("polars").with_columns(
         pl.when(pl.col("petal_length") < 2)
@@ -27,11 +32,16 @@ def sample_data2():
     return df
 
 
-@pytest.fixture
-def sample_2x2_data():
-    df = data.load_mtcars()
+@pytest.fixture(scope="session")
+def fitted_barstats(sample_data):
+    # only for tests that read the fit without plotting
+    return BarStats(x="cyl", y="vs", data=sample_data)
+
+
+@pytest.fixture(scope="session")
+def sample_2x2_data(sample_data):
     # Filter to get 2x2 contingency table
-    df_2x2 = df[df["cyl"].isin([4, 6])]
+    df_2x2 = sample_data[sample_data["cyl"].isin([4, 6])]
     return df_2x2
 
 
@@ -64,37 +74,48 @@ def test_fisher_exact_2x2(sample_2x2_data):
     assert bs.contingency_table.shape == (2, 2)
 
 
-def test_auto_approach_selects_fisher(sample_2x2_data):
-    bs = BarStats(x="cyl", y="vs", data=sample_2x2_data)
-    assert bs.test_name in ["Chi-square", "Fisher's exact"]
-
-
-def test_plot_stacked(sample_data):
-    fig, ax = plt.subplots()
+def test_plot_stacked(sample_data, ax):
     bs = BarStats(x="cyl", y="vs", data=sample_data)
     fig_out = bs.plot(ax=ax, plot_type="stacked")
 
     assert isinstance(fig_out, Figure)
     assert bs.ax == ax
-    plt.close(fig)
 
 
-def test_plot_grouped(sample_data):
-    fig, ax = plt.subplots()
+def test_plot_grouped(sample_data, ax):
     bs = BarStats(x="cyl", y="vs", data=sample_data)
     fig_out = bs.plot(ax=ax, plot_type="grouped")
 
     assert isinstance(fig_out, Figure)
     assert bs.ax == ax
-    plt.close(fig)
 
 
-@pytest.mark.parametrize("orientation", ["vertical", "horizontal"])
-@pytest.mark.parametrize("show_stats", [True, False])
-@pytest.mark.parametrize("show_counts", [True, False])
-@pytest.mark.parametrize("plot_type", ["stacked", "grouped"])
-def test_plot_options(sample_data, orientation, show_stats, show_counts, plot_type):
-    fig, ax = plt.subplots()
+# every pair of option values appears in at least one of these cases
+PLOT_OPTIONS_PAIRWISE = [
+    ("vertical", True, True, "stacked"),
+    ("vertical", False, False, "grouped"),
+    ("horizontal", True, False, "grouped"),
+    ("horizontal", False, True, "grouped"),
+    ("horizontal", False, False, "stacked"),
+]
+PLOT_OPTIONS_FULL = [
+    options
+    for options in itertools.product(
+        ["vertical", "horizontal"],
+        [True, False],
+        [True, False],
+        ["stacked", "grouped"],
+    )
+    if options not in PLOT_OPTIONS_PAIRWISE
+]
+
+
+@pytest.mark.parametrize(
+    "orientation,show_stats,show_counts,plot_type",
+    PLOT_OPTIONS_PAIRWISE
+    + [pytest.param(*options, marks=pytest.mark.slow) for options in PLOT_OPTIONS_FULL],
+)
+def test_plot_options(sample_data, ax, orientation, show_stats, show_counts, plot_type):
     bs = BarStats(x="cyl", y="vs", data=sample_data)
     fig_out = bs.plot(
         ax=ax,
@@ -106,55 +127,65 @@ def test_plot_options(sample_data, orientation, show_stats, show_counts, plot_ty
 
     assert isinstance(fig_out, Figure)
     assert bs.ax == ax
-    plt.close(fig)
-
 
-def test_attributes_exist(sample_data):
-    bs = BarStats(x="cyl", y="vs", data=sample_data)
 
-    # Check required attributes
-    assert hasattr(bs, "statistic")
-    assert hasattr(bs, "pvalue")
-    assert hasattr(bs, "test_name")
-    assert hasattr(bs, "contingency_table")
-    assert hasattr(bs, "n_obs")
-    assert hasattr(bs, "n_cat")
-    assert hasattr(bs, "n_levels")
-    assert hasattr(bs, "expression")
-    assert hasattr(bs, "cramers_v")
-
-    # Check data types
-    assert isinstance(bs.pvalue, (float, np.floating))
-    assert isinstance(bs.test_name, str)
-    assert isinstance(bs.contingency_table, np.ndarray)
-    assert isinstance(bs.n_obs, (int, np.integer))
-    assert isinstance(bs.n_cat, (int, np.integer))
-    assert isinstance(bs.n_levels, (int, np.integer))
-    assert isinstance(bs.expression, str)
-
-
-def test_error_invalid_approach(sample_data):
-    with pytest.raises(ValueError, match="`approach` must be one of"):
-        BarStats(x="cyl", y="vs", data=sample_data, approach="invalid")
-
-
-def test_error_invalid_orientation(sample_data):
-    with pytest.raises(
-        ValueError, match="`orientation` must be one of: 'vertical', 'horizontal'"
-    ):
-        BarStats(x="cyl", y="vs", data=sample_data).plot(orientation="invalid")
-
-
-def test_error_invalid_plot_type(sample_data):
-    bs = BarStats(x="cyl", y="vs", data=sample_data)
-    with pytest.raises(
-        ValueError, match="`plot_type` must be one of: 'stacked', 'grouped'"
-    ):
-        bs.plot(plot_type="invalid")
-
-
-def test_contingency_table_correct(sample_data):
-    bs = BarStats(x="cyl", y="vs", data=sample_data)
+EXPECTED_ATTRIBUTES = {
+    "statistic": object,
+    "pvalue": (float, np.floating),
+    "test_name": str,
+    "contingency_table": np.ndarray,
+    "n_obs": (int, np.integer),
+    "n_cat": (int, np.integer),
+    "n_levels": (int, np.integer),
+    "expression": str,
+    "cramers_v": object,
+}
+
+
+def test_attributes_exist(fitted_barstats):
+    attributes = vars(fitted_barstats)
+    assert not EXPECTED_ATTRIBUTES.keys() - attributes.keys()
+    for name, expected_type in EXPECTED_ATTRIBUTES.items():
+        assert isinstance(attributes[name], expected_type), name
+
+
+@pytest.mark.parametrize(
+    "init_kws, plot_kws, exception, match",
+    [
+        ({"approach": "invalid"}, {}, ValueError, "`approach` must be one of"),
+        (
+            {},
+            {"orientation": "invalid"},
+            ValueError,
+            "`orientation` must be one of: 'vertical', 'horizontal'",
+        ),
+        (
+            {},
+            {"plot_type": "invalid"},
+            ValueError,
+            "`plot_type` must be one of: 'stacked', 'grouped'",
+        ),
+        (
+            {"paired": True},
+            {},
+            NotImplementedError,
+            "Paired group comparison has not been implemented yet.",
+        ),
+        (
+            {"approach": "bayes"},
+            {},
+            NotImplementedError,
+            'Only `approach="freq"` has been implemented.',
+        ),
+    ],
+)
+def test_error_invalid_args(init_kws, plot_kws, exception, match):
+    with pytest.raises(exception, match=match):
+        BarStats(x="cyl", y="vs", data=TINY_DATA, **init_kws).plot(**plot_kws)
+
+
+def test_contingency_table_correct(fitted_barstats):
+    bs = fitted_barstats
 
     # Check that contingency table sums to total observations
     assert bs.contingency_table.sum() == bs.n_obs
@@ -166,8 +197,8 @@ def test_contingency_table_correct(sample_data):
     assert np.all(bs.contingency_table >= 0)
 
 
-def test_expression_format(sample_data):
-    bs = BarStats(x="cyl", y="vs", data=sample_data)
+def test_expression_format(fitted_barstats):
+    bs = fitted_barstats
 
     # Check that expression is properly formatted
     assert bs.expression.startswith("$")
@@ -183,26 +214,10 @@ def test_cramers_v_range(sample_data2):
     assert 0 <= bs.cramers_v <= 1, f"Cramer's V has unexpected value: {bs.cramers_v}"
 
 
-def test_colors_parameter(sample_data):
-    fig, ax = plt.subplots()
+def test_colors_parameter(sample_data, ax):
     bs = BarStats(x="cyl", y="vs", data=sample_data)
 
     custom_colors = ["red", "blue"]
     fig_out = bs.plot(ax=ax, colors=custom_colors)
 
     assert isinstance(fig_out, Figure)
-    plt.close(fig)
-
-
-def test_not_implemented_error(sample_data):
-    with pytest.raises(
-        NotImplementedError,
-        match="Paired group comparison has not been implemented yet.",
-    ):
-        BarStats(x="cyl", y="vs", data=sample_data, paired=True)
-
-    with pytest.raises(
-        NotImplementedError,
-        match='Only `approach="freq"` has been implemented.',
-    ):
-        BarStats(x="cyl", y="vs", data=sample_data, approach="bayes")
@@ -1,44 +1,206 @@
 import pytest
+import itertools
 import re
 import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.collections import PolyCollection
 from matplotlib.figure import Figure
-from matplotlib.axes import Axes
 
 from fleur import BetweenStats
 import fleur.data as data
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_data():
+    # load_iris() already returns a fresh frame, so renaming it in place
+    # avoids a second copy of the columns
     df = data.load_iris()
-    df = df.rename(columns={"species": "x", "sepal_length": "y"})
+    df.rename(columns={"species": "x", "sepal_length": "y"}, inplace=True)
     return df
 
 
-def test_default(sample_data):
-    fig = BetweenStats(sample_data["x"], sample_data["y"]).plot()
+@pytest.fixture(scope="session")
+def xy(sample_data):
+    return sample_data["x"], sample_data["y"]
+
+
+@pytest.fixture(scope="session")
+def xy_2cat(sample_data):
+    df = sample_data[sample_data["x"] != "setosa"]
+    return df["x"], df["y"]
+
+
+@pytest.fixture(scope="session")
+def xy_1cat(sample_data):
+    df = sample_data[sample_data["x"] == "setosa"]
+    return df["x"], df["y"]
+
+
+@pytest.fixture(scope="session")
+def fitted_betweenstats(xy):
+    # the fit does not depend on the plot options, so it is shared
+    return BetweenStats(*xy)
+
+
+def test_default(xy):
+    fig = BetweenStats(*xy).plot()
     assert isinstance(fig, Figure), f"Expected a matplotlib Figure, not: {type(fig)}"
-    plt.close(fig)
 
 
-def test_custom_ax(sample_data):
-    fig, ax = plt.subplots()
-    bs = BetweenStats(sample_data["x"], sample_data["y"])
+@pytest.mark.parametrize("mathtext", [True, False])
+def test_mathtext(xy, ax, mathtext):
+    BetweenStats(*xy).plot(ax=ax, mathtext=mathtext)
+    text = ax.texts[0].get_text()
+    assert text.startswith("$") == mathtext
+    assert "p = 0.0000" in text
+
+    mean_labels = [t.get_text() for t in ax.texts[1:]]
+    assert len(mean_labels) == 3
+    assert all(("$" in label) == mathtext for label in mean_labels)
+
+
+def test_scatter_kws(xy, ax):
+    BetweenStats(*xy).plot(
+        ax=ax, scatter_kws={"alpha": 0.2, "marker": "s"}, box_kws={"widths": 0.3}
+    )
+    (points,) = [c for c in ax.collections if len(c.get_offsets()) == len(xy[0])]
+    assert points.get_alpha() == 0.2
+
+
+@pytest.mark.parametrize(
+    "box_kws",
+    [{"whis": (5, 95)}, {"whis": 0.5}, {"notch": True}],
+)
+def test_box_kws(xy, ax, box_kws):
+    bs = BetweenStats(*xy)
+    bs.plot(
+        ax=ax,
+        orientation="vertical",
+        box_kws=box_kws,
+        violin=False,
+        scatter=False,
+        show_means=False,
+    )
+
+    # same boxes, whiskers and fliers as matplotlib's own boxplot()
+    _, ref_ax = plt.subplots()
+    ref_ax.boxplot(bs._result, **box_kws)
+    assert len(ax.lines) == len(ref_ax.lines)
+    for line, ref_line in zip(ax.lines, ref_ax.lines):
+        np.testing.assert_allclose(line.get_ydata(), ref_line.get_ydata())
+
+
+@pytest.mark.parametrize(
+    "rc",
+    [
+        {"boxplot.showfliers": False},
+        {"boxplot.showmeans": True},
+        {"boxplot.showmeans": True, "boxplot.meanline": True},
+        {"boxplot.showcaps": False},
+        {"boxplot.patchartist": True},
+        {"boxplot.notch": True},
+        {"boxplot.notch": True, "boxplot.bootstrap": 100},
+    ],
+)
+def test_box_rc_params(xy, ax, rc):
+    with plt.rc_context(rc):
+        bs = BetweenStats(*xy)
+        bs.plot(
+            ax=ax,
+            orientation="vertical",
+            violin=False,
+            scatter=False,
+            show_means=False,
+        )
+        _, ref_ax = plt.subplots()
+        ref_ax.boxplot(bs._result)
+
+    assert len(ax.lines) == len(ref_ax.lines)
+    assert len(ax.patches) == len(ref_ax.patches)
+
+
+@pytest.mark.parametrize(
+    "violin_kws",
+    [
+        {"showmedians": True, "points": 50},
+        {"bw_method": 0.5},
+        {"quantiles": [[0.25, 0.75]] * 3},
+    ],
+)
+def test_violin_kws(xy, ax, violin_kws):
+    BetweenStats(*xy).plot(ax=ax, violin_kws=violin_kws, box=False, scatter=False)
+    bodies = [c for c in ax.collections if isinstance(c, PolyCollection)]
+    assert len(bodies) == 3
+
+
+def test_custom_ax(xy, ax):
+    bs = BetweenStats(*xy)
     bs.plot(ax=ax)
     assert bs.ax == ax, "Expected the returned Axes to be the same as the input Axes"
-    plt.close(fig)
-
-
-@pytest.mark.parametrize("violin", [True, False])
-@pytest.mark.parametrize("box", [True, False])
-@pytest.mark.parametrize("scatter", [True, False])
-@pytest.mark.parametrize("colors", [None, ["#005f73", "#ee9b00", "#9b2226"]])
-@pytest.mark.parametrize("jitter_amount", [0, 0.25, 1])
-@pytest.mark.parametrize("orientation", ["horizontal", "vertical"])
-@pytest.mark.parametrize("show_stats", [True, False])
-@pytest.mark.parametrize("show_means", [True, False])
-def test_plot_expected_attributes(
-    sample_data,
+
+
+EXPECTED_ATTRIBUTES = {
+    "statistic": float,
+    "pvalue": float,
+    "main_stat": str,
+    "n_cat": int,
+    "n_obs": int,
+    "name": str,
+    "dof_between": object,
+    "dof_within": object,
+    "means": object,
+    "test_output": object,
+    "is_paired": bool,
+    "is_ANOVA": bool,
+}
+
+COLORS = ["#005f73", "#ee9b00", "#9b2226"]
+
+# every pair of option values appears in at least one of these cases
+PLOT_OPTIONS_PAIRWISE = [
+    ("horizontal", True, True, True, True, True, None, 0),
+    ("horizontal", False, False, False, False, False, COLORS, 0.25),
+    ("vertical", True, True, True, False, False, COLORS, 1),
+    ("vertical", False, False, False, True, True, None, 1),
+    ("vertical", True, True, False, True, True, COLORS, 0.25),
+    ("vertical", False, False, True, False, False, None, 0),
+    ("horizontal", True, False, True, True, False, None, 0.25),
+    ("horizontal", False, True, False, False, True, COLORS, 0),
+    ("horizontal", True, True, True, True, True, None, 1),
+]
+PLOT_OPTIONS_FULL = [
+    options
+    for options in itertools.product(
+        ["horizontal", "vertical"],
+        [True, False],
+        [True, False],
+        [True, False],
+        [True, False],
+        [True, False],
+        [None, COLORS],
+        [0, 0.25, 1],
+    )
+    if options not in PLOT_OPTIONS_PAIRWISE
+]
+
+
+def test_fit_attributes(fitted_betweenstats):
+    assert fitted_betweenstats.name == "One-way"
+
+    attributes = vars(fitted_betweenstats)
+    assert not EXPECTED_ATTRIBUTES.keys() - attributes.keys()
+    for name, expected_type in EXPECTED_ATTRIBUTES.items():
+        assert isinstance(attributes[name], expected_type), name
+
+
+@pytest.mark.parametrize(
+    "orientation,show_stats,show_means,violin,box,scatter,colors,jitter_amount",
+    PLOT_OPTIONS_PAIRWISE
+    + [pytest.param(*options, marks=pytest.mark.slow) for options in PLOT_OPTIONS_FULL],
+)
+def test_plot_options(
+    fitted_betweenstats,
+    ax,
     orientation,
     show_stats,
     show_means,
@@ -48,8 +210,7 @@ def test_plot_expected_attributes(
     colors,
     jitter_amount,
 ):
-    fig, ax = plt.subplots()
-    bs = BetweenStats(sample_data["x"], sample_data["y"])
+    bs = fitted_betweenstats
     fig_out = bs.plot(
         orientation=orientation,
         show_stats=show_stats,
@@ -61,160 +222,34 @@ def test_plot_expected_attributes(
         colors=colors,
         jitter_amount=jitter_amount,
     )
-    assert bs.name == "One-way"
-    assert fig_out == fig
-
-    assert hasattr(bs, "ax")
-    assert hasattr(bs, "statistic")
-    assert hasattr(bs, "pvalue")
-    assert hasattr(bs, "main_stat")
-    assert hasattr(bs, "n_cat")
-    assert hasattr(bs, "n_obs")
-    assert hasattr(bs, "name")
-    assert hasattr(bs, "dof_between")
-    assert hasattr(bs, "dof_within")
-    assert hasattr(bs, "means")
-    assert hasattr(bs, "test_output")
-    assert hasattr(bs, "is_paired")
-    assert hasattr(bs, "is_ANOVA")
-
     assert isinstance(fig_out, Figure)
-    assert isinstance(ax, Axes)
-    assert isinstance(bs.statistic, float)
-    assert isinstance(bs.pvalue, float)
-    assert isinstance(bs.main_stat, str)
-    assert isinstance(bs.n_cat, int)
-    assert isinstance(bs.n_obs, int)
-    assert isinstance(bs.is_paired, bool)
-    assert isinstance(bs.is_ANOVA, bool)
-
-    plt.close(fig)
-
-
-@pytest.mark.parametrize("approach", ["parametric", "nonparametric"])
-def test_three_categories(sample_data, approach):
-    bs = BetweenStats(
-        sample_data["x"],
-        sample_data["y"],
-        paired=False,
-        approach=approach,
-    )
-
-    if approach == "parametric":
-        assert bs.name == "One-way"
-    elif approach == "nonparametric":
-        assert bs.name == "Kruskal-Wallis"
-
-
-@pytest.mark.parametrize("equal_var", [True, False])
-def test_equal_var(sample_data, equal_var):
-    sample_data = sample_data[sample_data["x"] != "setosa"]
-    bs = BetweenStats(sample_data["x"], sample_data["y"], equal_var=equal_var)
-
-    if equal_var:
-        assert bs.name == "Student"
-    else:
-        assert bs.name == "Welch"
-
-
-@pytest.mark.parametrize("approach", ["parametric", "nonparametric"])
-@pytest.mark.parametrize("paired", [True, False])
-def test_two_categories(sample_data, paired, approach):
-    sample_data = sample_data[sample_data["x"] != "setosa"]
-
-    bs = BetweenStats(
-        sample_data["x"],
-        sample_data["y"],
-        paired=paired,
-        approach=approach,
-    )
-
-    assert hasattr(bs, "dof")
-
-    if paired:
-        if approach == "parametric":
-            assert bs.name == "Paired t-test"
-        elif approach == "nonparametric":
-            assert bs.name == "Wilcoxon"
-    else:
-        if approach == "parametric":
-            assert bs.name == "Student"
-        elif approach == "nonparametric":
-            assert bs.name == "Mann-Whitney"
-
-
-def test_not_enough_categories(sample_data):
-    sample_data = sample_data[sample_data["x"] == "setosa"]
-
-    with pytest.raises(
-        ValueError,
-        match="You must have at least 2 distinct categories in your category column",
-    ):
-        BetweenStats(sample_data["x"], sample_data["y"])
-
-
-@pytest.mark.parametrize("approach", ["robust", "bayes"])
-def test_raise_notimplemented_error(sample_data, approach):
-    with pytest.raises(
-        NotImplementedError,
-        match="Repeated measures ANOVA has not been implemented yet.",
-    ):
-        BetweenStats(sample_data["x"], sample_data["y"], paired=True)
-
-    with pytest.raises(
-        NotImplementedError,
-        match='Only `approach="parametric"` and `approach="nonparametric"` are implemented.',
-    ):
-        BetweenStats(sample_data["x"], sample_data["y"], approach=approach)
-
-    with pytest.raises(
-        NotImplementedError, match="Welch's ANOVA is not implemented yet."
-    ):
-        BetweenStats(sample_data["x"], sample_data["y"], equal_var=False).plot()
+    assert fig_out == ax.figure
+    assert bs.ax is ax
 
 
 @pytest.mark.parametrize(
-    "approach, paired, expected_exception, match",
+    "data_fixture, kwargs, expected_name",
     [
+        ("xy", {"approach": "parametric"}, "One-way"),
+        ("xy", {"approach": "nonparametric"}, "Kruskal-Wallis"),
+        ("xy_2cat", {"equal_var": True}, "Student"),
+        ("xy_2cat", {"equal_var": False}, "Welch"),
+        ("xy_2cat", {"approach": "parametric"}, "Student"),
+        ("xy_2cat", {"approach": "nonparametric"}, "Mann-Whitney"),
         (
-            "bayes",
-            False,
-            NotImplementedError,
-            (
-                'Only `approach="parametric"`, `approach="nonparametric"` '
-                'and `approach="robust"` have been implemented for '
-                "independant samples."
-            ),
-        ),
-        (
-            "robust",
-            True,
-            NotImplementedError,
-            (
-                'Only `approach="parametric"` and `approach="nonparametric"` '
-                "have been implemented for paired samples."
-            ),
-        ),
-        (
-            "bayes",
-            True,
-            NotImplementedError,
-            (
-                'Only `approach="parametric"` and `approach="nonparametric"` '
-                "have been implemented for paired samples."
-            ),
+            "xy_2cat",
+            {"paired": True, "approach": "parametric"},
+            "Paired t-test",
         ),
+        ("xy_2cat", {"paired": True, "approach": "nonparametric"}, "Wilcoxon"),
     ],
 )
-def test_raise_notimplemented_error2(
-    sample_data, approach, paired, expected_exception, match
-):
-    sample_data = sample_data[sample_data["x"] != "setosa"]
+def test_test_selection(request, data_fixture, kwargs, expected_name):
+    bs = BetweenStats(*request.getfixturevalue(data_fixture), **kwargs)
 
-    with pytest.raises(expected_exception, match=match):
-        BetweenStats(
-            sample_data["x"], sample_data["y"], approach=approach, paired=paired
-        )
+    assert bs.name == expected_name
+    if bs.n_cat == 2:
+        assert hasattr(bs, "dof")
 
 
 @pytest.mark.parametrize(
@@ -244,35 +279,33 @@ def test_raise_notimplemented_error2(
         ),
     ],
 )
-def test_warns_for_robust_approach_without_trim(
-    sample_data, approach, trim, warning_match
-):
-    sample_data = sample_data[sample_data["x"] != "setosa"]
-
+def test_warns_for_robust_approach_without_trim(xy_2cat, approach, trim, warning_match):
     if trim is None:
 
         def warn_call():
-            BetweenStats(sample_data["x"], sample_data["y"], approach=approach)
+            BetweenStats(*xy_2cat, approach=approach)
     else:
 
         def warn_call():
             BetweenStats(
-                sample_data["x"], sample_data["y"], trim=trim, approach=approach
+                *xy_2cat,
+                trim=trim,
+                approach=approach,
             )
 
     with pytest.warns(Warning, match=warning_match):
         warn_call()
 
 
-def test_warn_trim_without_robust(sample_data):
-    sample_data = sample_data[sample_data["x"] != "setosa"]
-
+def test_warn_trim_without_robust(xy_2cat):
     with pytest.warns(
         UserWarning,
         match='Using `trim` argument without expliciting `approach="robust"` is not recommended.',
     ):
         BetweenStats(
-            sample_data["x"], sample_data["y"], approach="parametric", trim=0.2
+            *xy_2cat,
+            approach="parametric",
+            trim=0.2,
         )
 
     with pytest.raises(
@@ -284,29 +317,118 @@ def test_warn_trim_without_robust(sample_data):
             match='Using `trim` argument without expliciting `approach="robust"` is not recommended.',
         ):
             BetweenStats(
-                sample_data["x"], sample_data["y"], approach="nonparametric", trim=0.2
+                *xy_2cat,
+                approach="nonparametric",
+                trim=0.2,
             )
 
 
-def test_error_invalid_orientation(sample_data):
-    with pytest.raises(
+NOT_IMPLEMENTED_PAIRED = (
+    'Only `approach="parametric"` and `approach="nonparametric"` '
+    "have been implemented for paired samples."
+)
+
+ERROR_CASES = [
+    (
+        "xy_1cat",
+        {},
+        {},
         ValueError,
-        match="`orientation` must be one of: 'vertical', 'horizontal'.",
-    ):
-        BetweenStats(sample_data["x"], sample_data["y"]).plot(orientation="invalid")
+        "You must have at least 2 distinct categories in your category column",
+    ),
+    (
+        "xy",
+        {"approach": "invalid"},
+        {},
+        ValueError,
+        r"^`approach` must be one of",
+    ),
+    (
+        "xy",
+        {},
+        {"orientation": "invalid"},
+        ValueError,
+        "`orientation` must be one of: 'vertical', 'horizontal'.",
+    ),
+    (
+        "xy",
+        {},
+        {"colors": ["#fff"]},
+        ValueError,
+        r"^`colors` argument must have at least",
+    ),
+    (
+        "xy",
+        {"paired": True},
+        {},
+        NotImplementedError,
+        "Repeated measures ANOVA has not been implemented yet.",
+    ),
+    (
+        "xy",
+        {"approach": "robust"},
+        {},
+        NotImplementedError,
+        'Only `approach="parametric"` and `approach="nonparametric"` are implemented.',
+    ),
+    (
+        "xy",
+        {"approach": "bayes"},
+        {},
+        NotImplementedError,
+        'Only `approach="parametric"` and `approach="nonparametric"` are implemented.',
+    ),
+    (
+        "xy",
+        {"equal_var": False},
+        {},
+        NotImplementedError,
+        "Welch's ANOVA is not implemented yet.",
+    ),
+    (
+        "xy_2cat",
+        {"approach": "bayes"},
+        {},
+        NotImplementedError,
+        (
+            'Only `approach="parametric"`, `approach="nonparametric"` '
+            'and `approach="robust"` have been implemented for '
+            "independant samples."
+        ),
+    ),
+    (
+        "xy_2cat",
+        {"approach": "robust", "paired": True},
+        {},
+        NotImplementedError,
+        NOT_IMPLEMENTED_PAIRED,
+    ),
+    (
+        "xy_2cat",
+        {"approach": "bayes", "paired": True},
+        {},
+        NotImplementedError,
+        NOT_IMPLEMENTED_PAIRED,
+    ),
+]
 
 
-def test_error_invalid_approach(sample_data):
-    with pytest.raises(
-        ValueError,
-        match=r"^`approach` must be one of",
-    ):
-        BetweenStats(sample_data["x"], sample_data["y"], approach="invalid")
+@pytest.mark.parametrize(
+    "data_fixture, init_kws, plot_kws, exception, match",
+    ERROR_CASES,
+    ids=[f"{case[3].__name__}-{i}" for i, case in enumerate(ERROR_CASES)],
+)
+def test_errors(request, data_fixture, init_kws, plot_kws, exception, match):
+    x, y = request.getfixturevalue(data_fixture)
+    with pytest.raises(exception, match=match):
+        BetweenStats(x, y, **init_kws).plot(**plot_kws)
 
 
-def test_error_invalid_colors(sample_data):
-    with pytest.raises(
-        ValueError,
-        match=r"^`colors` argument must have at least",
-    ):
-        BetweenStats(sample_data["x"], sample_data["y"]).plot(colors=["#fff"])
+@pytest.mark.parametrize("backend", ["pandas", "polars"])
+def test_labels_match_groups(backend):
+    df = data.load_iris(backend)
+    bs = BetweenStats("species", "sepal_length", data=df)
+
+    expected_means = data.load_iris().groupby("species")["sepal_length"].mean()
+    for label, mean in zip(bs._cat_labels, bs.means):
+        assert mean == pytest.approx(expected_means[label])
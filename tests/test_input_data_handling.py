@@ -3,23 +3,22 @@ import pandas as pd
 import polars as pl
 import numpy as np
 
-from typing import Dict
-
 from fleur._utils import _InputDataHandler
 
 import pytest
 
 
-@pytest.mark.parametrize("backend", ["pandas", "polars"])
-def test_output_scheme(backend):
-    df = nw.from_dict(
-        {"height": [150, 160, 170], "weight": [50, 60, 70]}, backend=backend
+@pytest.fixture(scope="session", params=["pandas", "polars"])
+def height_weight(request):
+    return nw.from_dict(
+        {"height": [150, 160, 170], "weight": [50, 60, 70]}, backend=request.param
     )
-    info_df = _InputDataHandler("height", "weight", data=df).get_info()
 
-    x_series = nw.new_series("height", [150, 160, 170], backend=backend)
-    y_series = nw.new_series("weight", [50, 60, 70], backend=backend)
-    info_series = _InputDataHandler(x_series, y_series).get_info()
+
+def test_output_scheme(height_weight):
+    df = height_weight
+    info_df = _InputDataHandler("height", "weight", data=df).get_info()
+    info_series = _InputDataHandler(df["height"], df["weight"]).get_info()
 
     expected_keys = [
         "x",
@@ -31,25 +30,48 @@ def test_output_scheme(backend):
     ]
 
     for info in [info_df, info_series]:
-        assert isinstance(info, Dict)
+        assert isinstance(info, dict)
         assert list(info) == expected_keys
 
     assert info_df["source"] == "dataframe"
     assert info_series["source"] == "series"
 
 
+def test_narwhals_dataframe_is_not_rewrapped():
+    df = nw.from_native(pd.DataFrame({"height": [150, 160], "weight": [50, 60]}))
+    info = _InputDataHandler("height", "weight", data=df).get_info()
+    assert info["dataframe"] is df
+
+
+def test_narwhals_series_are_not_rewrapped():
+    x = nw.new_series("height", [150, 160], backend="pandas")
+    y = nw.new_series("weight", [50, 60], backend="pandas")
+    info = _InputDataHandler(x, y).get_info()
+    assert info["x"] is x
+    assert info["y"] is y
+    assert info["x_name"] == "height"
+
+
+def _series_case(native):
+    x, y = native([1, 2, 3]), native([1, 2, 3])
+    return (
+        x,
+        y,
+        nw.from_native(x, series_only=True),
+        nw.from_native(y, series_only=True),
+    )
+
+
 @pytest.mark.parametrize(
-    ["x", "y"],
-    [
-        (pd.Series([1, 2, 3]), pd.Series([1, 2, 3])),
-        (pl.Series([1, 2, 3]), pl.Series([1, 2, 3])),
-    ],
+    ["x", "y", "expected_x", "expected_y"],
+    [_series_case(pd.Series), _series_case(pl.Series)],
+    ids=["pandas", "polars"],
 )
-def test_different_x_and_y_input_series(x, y):
+def test_different_x_and_y_input_series(x, y, expected_x, expected_y):
     info_df = _InputDataHandler(x, y).get_info()
 
-    assert info_df["x"] == nw.from_native(x, allow_series=True)
-    assert info_df["y"] == nw.from_native(y, allow_series=True)
+    assert (info_df["x"] == expected_x).all()
+    assert (info_df["y"] == expected_y).all()
 
     assert isinstance(info_df["x"], nw.Series)
     assert isinstance(info_df["y"], nw.Series)
@@ -57,18 +79,23 @@ def test_different_x_and_y_input_series(x, y):
     assert info_df["source"] == "series"
 
 
+EXPECTED_X: nw.Series = nw.new_series("x", [1, 2, 3], backend="pandas")
+EXPECTED_Y: nw.Series = nw.new_series("y", [1, 2, 3], backend="pandas")
+
+
 @pytest.mark.parametrize(
     ["x", "y"],
     [
         ([1, 2, 3], [1, 2, 3]),
         (np.array([1, 2, 3]), np.array([1, 2, 3])),
     ],
+    ids=["list", "numpy"],
 )
 def test_different_x_and_y_input_arrays(x, y):
     info_df = _InputDataHandler(x, y).get_info()
 
-    assert info_df["x"] == nw.new_series("x", x, backend="pandas")
-    assert info_df["y"] == nw.new_series("y", y, backend="pandas")
+    assert (info_df["x"] == EXPECTED_X).all()
+    assert (info_df["y"] == EXPECTED_Y).all()
 
     assert isinstance(info_df["x"], nw.Series)
     assert isinstance(info_df["y"], nw.Series)
@@ -29,6 +29,16 @@ def test_load_data_polars(dataset):
     assert not df.is_empty()
 
 
+@pytest.mark.parametrize("backend", ["pandas", "polars"])
+def test_load_data_returns_copies(backend):
+    df = _load_data("iris", backend=backend)
+    assert _load_data("iris", backend=backend) is not df
+
+    if backend == "pandas":
+        df["sepal_length"] = 0
+        assert (_load_data("iris", backend=backend)["sepal_length"] != 0).all()
+
+
 def test_load_iris():
     df = load_iris()
     assert len(df) == 150
@@ -1,22 +1,45 @@
 import pytest
+import itertools
 import matplotlib.pyplot as plt
+import numpy as np
 from matplotlib.patches import Rectangle
+from scipy import stats as st
 
-from fleur import ScatterStats
+from fleur import ScatterStats, scatterstats_batch
 from fleur import data
+from fleur.scatterstats import N_BAND, _BUFFERS, _linregress
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_data():
     df = data.load_iris()
     df = df.rename(columns={"sepal_width": "x", "sepal_length": "y"})
     return df
 
 
-@pytest.mark.parametrize("alternative", ["two-sided", "less", "greater"])
-@pytest.mark.parametrize("effect_size", ["pearson", "kendall", "spearman"])
-@pytest.mark.parametrize("bins", [None, 10, [10, 10], [10, 20]])
-def test_default(sample_data, alternative, effect_size, bins):
+EXPECTED_ATTRIBUTES = {
+    "pvalue",
+    "intercept",
+    "slope",
+    "stderr_slope",
+    "ci_lower",
+    "ci_upper",
+    "n_obs",
+    "dof",
+    "alpha",
+}
+
+
+@pytest.mark.parametrize(
+    "alternative, effect_size",
+    list(
+        itertools.product(
+            ["two-sided", "less", "greater"], ["pearson", "kendall", "spearman"]
+        )
+    ),
+)
+def test_fit_attributes(sample_data, alternative, effect_size):
+    # the statistics are all set by __init__, no figure is needed
     ss = ScatterStats(
         sample_data["x"],
         sample_data["y"],
@@ -24,23 +47,18 @@ def test_default(sample_data, alternative, effect_size, bins):
         effect_size=effect_size,
     )
 
-    fig = ss.plot(bins=bins)
+    missing = EXPECTED_ATTRIBUTES - vars(ss).keys()
+    assert not missing, f"Missing attributes: {missing}"
 
-    assert isinstance(fig, plt.Figure), "Expected a matplotlib Figure object"
 
-    assert hasattr(ss, "pvalue")
-    assert hasattr(ss, "intercept")
-    assert hasattr(ss, "slope")
-    assert hasattr(ss, "stderr_slope")
-    assert hasattr(ss, "ci_lower")
-    assert hasattr(ss, "ci_upper")
-    assert hasattr(ss, "n_obs")
-    assert hasattr(ss, "dof")
-    assert hasattr(ss, "alpha")
-    assert hasattr(ss, "fig")
-    assert hasattr(ss, "ax")
+@pytest.mark.parametrize("bins", [None, 10, [10, 10], [10, 20], (10, 20)])
+def test_default(sample_data, bins):
+    ss = ScatterStats(sample_data["x"], sample_data["y"])
+    fig = ss.plot(bins=bins)
 
-    plt.close(fig)
+    assert isinstance(fig, plt.Figure), "Expected a matplotlib Figure object"
+    assert ss.fig is fig
+    assert ss.ax in fig.axes
 
 
 def test_style_params(sample_data):
@@ -59,29 +77,46 @@ def test_style_params(sample_data):
     line = axesA.get_lines()[0]
     assert line.get_color() == "#1f77b4"
 
-    n_rectangle_axesC = sum(
-        isinstance(item, Rectangle) for item in axesC.get_children()
-    )
-    n_rectangle_axesB = sum(
-        isinstance(item, Rectangle) for item in axesB.get_children()
-    )
-    assert n_rectangle_axesC >= 10, f"{axesC.get_children()}"
-    assert n_rectangle_axesB >= 10, f"{axesB.get_children()}"
+    # ax.patches holds the histogram bars only, not the background patch
+    for hist_ax in (axesB, axesC):
+        assert len(hist_ax.patches) >= 10, f"{hist_ax.patches}"
+        assert all(isinstance(bar, Rectangle) for bar in hist_ax.patches)
 
 
-def test_raise_warning(sample_data):
+@pytest.mark.parametrize("plot_kws", [{"bins": 20}, {"hist_kws": {"color": "red"}}])
+def test_raise_warning(sample_data, plot_kws):
     with pytest.warns(
         UserWarning, match="bins/hist_kws arguments are ignored when hist=False."
     ):
-        ScatterStats(sample_data["x"], sample_data["y"]).plot(bins=20, hist=False)
+        ScatterStats(sample_data["x"], sample_data["y"]).plot(hist=False, **plot_kws)
 
-    with pytest.warns(
-        UserWarning, match="bins/hist_kws arguments are ignored when hist=False."
-    ):
-        ScatterStats(sample_data["x"], sample_data["y"]).plot(
-            hist_kws={"color": "red"},
-            hist=False,
-        )
+
+def test_without_stats(sample_data):
+    ss = ScatterStats(sample_data["x"], sample_data["y"], stats=False)
+    reference = ScatterStats(sample_data["x"], sample_data["y"])
+
+    assert ss.slope == pytest.approx(reference.slope)
+    assert ss.intercept == pytest.approx(reference.intercept)
+    assert not hasattr(ss, "pvalue")
+
+    fig = ss.plot()
+    assert len(fig.texts) == 0
+    assert len(ss.ax.collections) == 1  # scatter only, no confidence area
+
+
+@pytest.mark.parametrize("stats", [True, False])
+def test_identical_x(stats):
+    with pytest.raises(ValueError, match="all x values are identical"):
+        ScatterStats([1.0, 1.0, 1.0], [1.0, 2.0, 3.0], stats=stats)
+
+
+@pytest.mark.parametrize("mathtext", [True, False])
+def test_mathtext(sample_data, mathtext):
+    fig = ScatterStats(sample_data["x"], sample_data["y"]).plot(mathtext=mathtext)
+    texts = [text.get_text() for text in fig.texts]
+    assert len(texts) == 2
+    assert all(text.startswith("$") == mathtext for text in texts)
+    assert "p = 0.1828" in texts[0]
 
 
 def test_effect_size_invalid(sample_data):
@@ -90,3 +125,92 @@ def test_effect_size_invalid(sample_data):
         match="effect_size argument must be one of: 'pearson', 'kendall', 'spearman'.",
     ):
         ScatterStats(sample_data["x"], sample_data["y"], effect_size="invalid")
+
+
+def test_alternative_invalid(sample_data):
+    with pytest.raises(
+        ValueError,
+        match="alternative argument must be one of: 'two-sided', 'less', 'greater'.",
+    ):
+        ScatterStats(sample_data["x"], sample_data["y"], alternative="invalid")
+
+
+@pytest.mark.parametrize("alternative", ["two-sided", "less", "greater"])
+@pytest.mark.parametrize("n", [2, 3, 150])
+def test_linregress_matches_scipy(alternative, n):
+    rng = np.random.default_rng(n)
+    x = rng.normal(size=n)
+    y = 0.5 * x + rng.normal(size=n)
+
+    regression = _linregress(x, y, alternative=alternative)
+    expected = st.linregress(x, y, alternative=alternative)
+    for key in ["slope", "intercept", "rvalue", "pvalue", "stderr"]:
+        assert getattr(regression, key) == pytest.approx(getattr(expected, key))
+
+
+def test_linregress_identical_x():
+    with pytest.raises(ValueError, match="all x values are identical"):
+        _linregress(np.ones(5), np.arange(5.0), alternative="two-sided")
+
+
+def test_fit_does_not_pool_large_buffers():
+    x = np.linspace(0, 1, 10 * N_BAND)
+    ScatterStats(x, 2 * x + np.sin(x)).plot()
+    assert all(buffer.size <= N_BAND for buffer in vars(_BUFFERS).values())
+
+
+BATCH_KEYS = {
+    "slope",
+    "intercept",
+    "stderr_slope",
+    "correlation",
+    "pvalue",
+    "ci_lower",
+    "ci_upper",
+}
+
+
+@pytest.mark.parametrize("alternative", ["two-sided", "less", "greater"])
+def test_batch_matches_scatterstats(alternative):
+    rng = np.random.default_rng(0)
+    x = rng.normal(size=(4, 30))
+    y = 2 * x + rng.normal(size=(4, 30))
+
+    batch = scatterstats_batch(x, y, alternative=alternative)
+    assert batch.keys() == BATCH_KEYS
+    assert all(values.shape == (4,) for values in batch.values())
+
+    for i in range(4):
+        ss = ScatterStats(x[i], y[i], alternative=alternative)
+        for key, values in batch.items():
+            assert values[i] == pytest.approx(getattr(ss, key))
+
+
+def test_batch_alternative_invalid():
+    with pytest.raises(
+        ValueError,
+        match="alternative argument must be one of: 'two-sided', 'less', 'greater'.",
+    ):
+        scatterstats_batch([1, 2, 3], [1, 2, 3], alternative="invalid")
+
+
+@pytest.mark.parametrize(
+    "x, y, match",
+    [
+        (5.0, 5.0, "at least 3 observations"),
+        ([1, 2], [1, 2], "at least 3 observations"),
+        ([[1, 1, 1], [1, 2, 3]], [[1, 2, 3], [1, 2, 3]], "all x values are identical"),
+    ],
+)
+def test_batch_degenerate_input(x, y, match):
+    with pytest.raises(ValueError, match=match):
+        scatterstats_batch(x, y)
+
+
+@pytest.mark.filterwarnings("error::RuntimeWarning")
+@pytest.mark.parametrize("y", [[1, 2, 3], [2, 2, 2]])
+def test_batch_exact_fit_matches_scatterstats(y):
+    batch = scatterstats_batch([1, 2, 3], y)
+    ss = ScatterStats([1.0, 2.0, 3.0], y)
+    for key, value in batch.items():
+        assert value == pytest.approx(getattr(ss, key))
@@ -1,10 +1,23 @@
 import fleur
-from fleur._utils import _count_n_decimals, _infer_types
+from fleur.data import load_mtcars
+from fleur._utils import (
+    _count_n_decimals,
+    _infer_types,
+    _themify,
+    _violin_stats,
+    _box_stats,
+    _get_cycle_colors,
+    _beeswarm,
+)
 
 import pytest
+import subprocess
+import sys
 
 import matplotlib.pyplot as plt
+from matplotlib import cbook
 import narwhals as nw
+import numpy as np
 import pandas as pd
 
 
@@ -12,6 +25,11 @@ def test_version():
     assert fleur.__version__ == "0.0.4"
 
 
+def test_import_is_lazy_on_scipy():
+    code = "import sys, fleur; assert 'scipy.stats' not in sys.modules"
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
 def test_count_n_decimals():
     assert _count_n_decimals(12.3456) == 4
     assert _count_n_decimals(0.123) == 3
@@ -48,8 +66,88 @@ def test_infer_types():
         _infer_types("x", "y", data4)
 
 
-@pytest.fixture
-def ax():
-    fig, ax = plt.subplots()
-    yield ax
-    plt.close(fig)
+def test_themify_context():
+    with fleur.themify_context():
+        fig, ax = plt.subplots()
+    assert not any(spine.get_visible() for spine in ax.spines.values())
+    assert plt.rcParams["axes.spines.top"]
+
+
+@pytest.mark.parametrize(
+    "orientation, grid_axis, hidden_axis",
+    [("horizontal", "xaxis", "yaxis"), ("vertical", "yaxis", "xaxis")],
+)
+def test_themify_context_keeps_single_grid(orientation, grid_axis, hidden_axis):
+    df = load_mtcars()
+    with fleur.themify_context():
+        _, ax = plt.subplots()
+        fleur.BarStats(x="cyl", y="vs", data=df).plot(ax=ax, orientation=orientation)
+
+    assert all(line.get_visible() for line in getattr(ax, grid_axis).get_gridlines())
+    assert not any(
+        line.get_visible() for line in getattr(ax, hidden_axis).get_gridlines()
+    )
+
+
+def test_themify(ax):
+    _themify(ax, grid_axis="x")
+    assert not any(spine.get_visible() for spine in ax.spines.values())
+
+
+def test_violin_stats(ax):
+    rng = np.random.default_rng(0)
+    groups = [rng.normal(size=50), rng.gamma(2, size=300), np.ones(5)]
+
+    # same violins as matplotlib for groups below the subsampling threshold
+    expected = ax.violinplot(groups)["bodies"]
+    drawn = ax.violin(_violin_stats(groups))["bodies"]
+    for body, expected_body in zip(drawn, expected):
+        assert body.get_paths()[0].vertices == pytest.approx(
+            expected_body.get_paths()[0].vertices
+        )
+
+    large = rng.normal(size=5_000)
+    subsampled = _violin_stats([large], max_kde_points=500)[0]["vals"]
+    full = _violin_stats([large])[0]["vals"]
+    assert np.abs(subsampled - full).max() < 0.01 * full.max()
+
+
+@pytest.mark.parametrize("whis", [1.5, 0.5, (5, 95), (0, 100)])
+def test_box_stats(whis):
+    rng = np.random.default_rng(0)
+    groups = [rng.normal(size=50), rng.standard_cauchy(size=300), np.ones(5)]
+
+    for stats, expected in zip(
+        _box_stats(groups, whis=whis), cbook.boxplot_stats(groups, whis=whis)
+    ):
+        for key in ["mean", "med", "q1", "q3", "iqr", "whislo", "whishi"]:
+            assert stats[key] == pytest.approx(expected[key])
+        assert np.sort(stats["fliers"]) == pytest.approx(np.sort(expected["fliers"]))
+
+
+def test_cycle_colors_follow_rcparams():
+    default_colors = _get_cycle_colors()
+    assert _get_cycle_colors() is default_colors
+
+    with plt.rc_context({"axes.prop_cycle": plt.cycler(color=["red", "blue"])}):
+        assert _get_cycle_colors() == ["red", "blue"]
+
+    assert _get_cycle_colors() == default_colors
+
+
+@pytest.mark.parametrize("n", [1, 7, 150, 1000])
+def test_beeswarm(n):
+    y = np.random.default_rng(n).normal(size=n)
+    x_offsets = _beeswarm(y, width=0.25)
+
+    assert x_offsets.shape == y.shape
+
+    # in each bin, points alternate right/left of the center, from bottom to top
+    _, bin_edges = np.histogram(y, bins=int(np.ceil(n / 6)))
+    for ymin, ymax in zip(bin_edges[:-1], bin_edges[1:]):
+        in_bin = np.sort(np.where((y > ymin) & (y <= ymax))[0])
+        in_bin = in_bin[np.argsort(y[in_bin])]
+        offsets = x_offsets[in_bin]
+        assert (offsets[::2] > 0).all()
+        assert (offsets[1::2] < 0).all()
+        assert (np.diff(offsets[::2]) > 0).all()